@@ -0,0 +1,39 @@
+import csv
+import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pa_csv
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+
+def _present_columns(path: str | Path, usecols: Sequence[str]) -> List[str]:
+    """Subset of `usecols` found in the CSV header (optional columns may be absent)."""
+    with open(path, newline="") as f:
+        header = next(csv.reader(f), [])
+    return [col for col in usecols if col in header]
+
+
+def read_csv(
+    path: str | Path,
+    str_columns: List[str],
+    usecols: Optional[Sequence[str]] = None,
+) -> pd.DataFrame:
+    """
+    Read a CSV file, keeping `str_columns` as strings. When `usecols` is given,
+    only those columns (of the ones present in the file) are parsed.
+
+    Uses PyArrow's multithreaded CSV reader. Column types are forced at parse time
+    so identifiers such as CIKs and CUSIPs keep their leading zeros.
+    """
+    if usecols is not None:
+        usecols = _present_columns(path, usecols)
+
+    column_types = {col: pa.string() for col in str_columns}
+    table = pa_csv.read_csv(
+        path,
+        convert_options=pa_csv.ConvertOptions(
+            column_types=column_types,
+            include_columns=usecols,
+        ),
+    )
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
@@ -0,0 +1,59 @@
+import socket
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+from typing import Optional
+
+from follow_the_leaders.secret_vars import SEC_HEADERS
+from follow_the_leaders._rate_limiter import SEC_RATE_LIMITER
+
+# Nagle off for small request bodies; TCP keep-alive probes so idle pooled
+# connections are not silently dropped by NATs/proxies between runs
+SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+if hasattr(socket, "TCP_KEEPIDLE"):  # not available on every platform
+    SOCKET_OPTIONS += [
+        (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60),
+        (socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 20),
+    ]
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled sockets use SOCKET_OPTIONS."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+
+def build_session(pool_maxsize: int = 20) -> requests.Session:
+    """Session with pooled keep-alive connections and retries on transient errors."""
+    session = requests.Session()
+    adapter = _KeepAliveAdapter(
+        pool_connections=20,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            # 429/503 Retry-After is honoured by default (respect_retry_after_header).
+            # Hand the final error response back so raise_for_status() reports it
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+# Used by fetchers that are not handed a session explicitly
+DEFAULT_SESSION = build_session()
+
+
+def sec_get(
+    url: str, session: Optional[requests.Session] = None, **kwargs
+) -> requests.Response:
+    """Rate-limited GET against SEC EDGAR."""
+    SEC_RATE_LIMITER.acquire()
+    return (session or DEFAULT_SESSION).get(url, headers=SEC_HEADERS, **kwargs)
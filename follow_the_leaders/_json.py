@@ -0,0 +1,12 @@
+import orjson
+from typing import Any
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON with orjson."""
+    return orjson.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes with orjson."""
+    return orjson.dumps(obj)
@@ -35,21 +35,21 @@ def configure_logger(log_level, log_dir: str = ""):
     _logger.addHandler(handler_console_out)
 
 
-def log_warm(log: str):
-    _logger.warning(log)
+def log_warm(log: str, *args):
+    _logger.warning(log, *args)
 
 
-def log_debug(log: str):
-    _logger.debug(log)
+def log_debug(log: str, *args):
+    _logger.debug(log, *args)
 
 
-def log_info(log: str):
-    _logger.info(log)
+def log_info(log: str, *args):
+    _logger.info(log, *args)
 
 
-def log_error(log: str):
-    _logger.error(log)
+def log_error(log: str, *args):
+    _logger.error(log, *args)
 
 
-def log_fatal(log: str):
-    _logger.fatal(log)
+def log_fatal(log: str, *args):
+    _logger.fatal(log, *args)
@@ -0,0 +1,38 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket limiting the number of requests per period.
+    Bursts up to `rate` requests, then blocks callers until tokens refill.
+    """
+
+    def __init__(self, rate: int, period: float = 1.0):
+        self.rate = rate
+        self.period = period
+        self._tokens = float(rate)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                elapsed = now - self._last_refill
+                self._tokens = min(
+                    self.rate, self._tokens + elapsed * self.rate / self.period
+                )
+                self._last_refill = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait = (1 - self._tokens) * self.period / self.rate
+
+            time.sleep(wait)
+
+
+# SEC EDGAR fair access policy: max 10 requests per second
+SEC_RATE_LIMITER = RateLimiter(rate=10, period=1.0)
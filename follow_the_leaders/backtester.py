@@ -1,8 +1,45 @@
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
 from typing import Optional
+import functools
+import os
 
 from follow_the_leaders.yfinance_fetcher import YFinanceFetcher
+from follow_the_leaders._csv import read_csv
+from numba import njit
+
+
+@functools.lru_cache(maxsize=8)
+def _load_cusip_lookup(path: str, mtime: float) -> pd.Series:
+    """
+    Parse the CUSIP -> ticker lookup CSV once per (path, mtime).
+    The mtime is part of the cache key so edits to the file are picked up.
+    """
+    lookup_df = read_csv(
+        path, str_columns=["cusip", "symbol"], usecols=["cusip", "symbol"]
+    )
+    lookup = pd.Series(
+        lookup_df["symbol"].to_numpy(), index=lookup_df["cusip"].to_numpy()
+    )
+    # Keep the last mapping for duplicated CUSIPs (reindex requires unique labels)
+    return lookup[~lookup.index.duplicated(keep="last")]
+
+
+@njit(cache=True)
+def _accumulate_buy_hold(prices: np.ndarray, shares: np.ndarray) -> np.ndarray:
+    """
+    Portfolio value per row; a missing price makes that row NaN.
+    Walks one asset column at a time to stream through Fortran-ordered prices,
+    accumulating in float64 so the row sums do not lose float32 precision.
+    """
+    n_rows, n_assets = prices.shape
+    out = np.zeros(n_rows, dtype=np.float64)
+    for j in range(n_assets):
+        asset_shares = shares[j]
+        for t in range(n_rows):
+            out[t] += prices[t, j] * asset_shares
+    return out.astype(prices.dtype)
 
 
 class Backtester:
@@ -29,9 +66,10 @@ class Backtester:
         self.end_date = start_date + time_delta
         self.initial_capital = initial_capital
 
-        # Load lookup file
-        self.lookup_df = pd.read_csv(lookup_file, dtype=str)
-        self.lookup_map = dict(zip(self.lookup_df["cusip"], self.lookup_df["symbol"]))
+        # Load lookup file (cached across instances)
+        self.lookup_series = _load_cusip_lookup(
+            os.path.abspath(lookup_file), os.path.getmtime(lookup_file)
+        )
 
     def map_holdings(self) -> pd.DataFrame:
         """
@@ -39,7 +77,9 @@ class Backtester:
         Skip holdings without a ticker.
         """
         mapped = self.holdings.copy()
-        mapped["ticker"] = mapped["cusip"].map(self.lookup_map)
+        mapped["ticker"] = self.lookup_series.reindex(
+            mapped["cusip"].to_numpy()
+        ).to_numpy()
 
         # Drop missing mappings
         unmapped = mapped[mapped["ticker"].isnull()]
@@ -67,26 +107,23 @@ class Backtester:
             tickers=tickers,
             interval="1d",
         )
-        price_data = fetcher.get_price_data("Adj Close")
+        # float32 is plenty for equity prices and halves the memory traffic
+        price_data = fetcher.get_price_data("Adj Close").astype(np.float32, copy=False)
 
-        # Equal-weight allocation
-        n_assets = len(tickers)
-        allocation = self.initial_capital / n_assets
+        # Tickers without any price data are skipped but keep their allocation slot
+        price_data = price_data.dropna(axis=1, how="all")
 
-        portfolio = pd.DataFrame(index=price_data.index)
-        portfolio_value = pd.Series(0.0, index=price_data.index)
+        # Column-major layout keeps each ticker's price history contiguous
+        prices = np.asfortranarray(price_data.to_numpy(dtype=np.float32))
+
+        # Equal-weight allocation
+        allocation = self.initial_capital / len(tickers)
+        shares = (allocation / prices[0]).astype(np.float32)
 
         # TODO: reimplement core backtester using quantitative_trading methods previously deved
-        for ticker in tickers:
-            series = price_data[ticker]
-            if series.isnull().all():
-                continue
-            first_price = series.iloc[0]
-            shares = allocation / first_price
-            position_value = shares * series
-            portfolio_value += position_value
-
-        portfolio["Portfolio"] = portfolio_value
+        # A missing price (or first price) leaves that day's portfolio value missing
+        portfolio = pd.DataFrame(index=price_data.index)
+        portfolio["Portfolio"] = _accumulate_buy_hold(prices, shares)
         return portfolio
 
 
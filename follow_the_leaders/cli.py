@@ -23,5 +23,12 @@ def app_parser():
         help="Useful for debugging purposes, it allows to run the daily check right away instead of waiting for the scheduler to call this.",
     )
 
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=5,
+        help="Number of watchlist entities processed concurrently. SEC requests stay capped at 10 per second.",
+    )
+
     arg = parser.parse_args()
     return arg
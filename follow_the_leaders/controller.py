@@ -13,13 +13,24 @@ from follow_the_leaders import (
     log_fatal,
 )
 
+from follow_the_leaders._csv import read_csv
+from follow_the_leaders._http import build_session
+from follow_the_leaders._rate_limiter import RateLimiter
+
 import pandas as pd
-from datetime import datetime
-import time
-from typing import Optional
+import numpy as np
+from datetime import date, datetime
+from concurrent.futures import ThreadPoolExecutor
+from itertools import compress
+import threading
+import queue
+from typing import List, Optional, Tuple
 
 
 class Controller:
+    ALERT_MAX_LENGTH = 4096  # Telegram's limit for a single message
+    ALERT_SEPARATOR = "\n\n"
+
     def __init__(
         self,
         funds_csv_path: str,
@@ -29,23 +40,54 @@ class Controller:
         end_date: Optional[datetime] = None,
         log_path: str = "data/processed_filings.csv",
         debug: bool = False,
+        max_workers: int = 5,
     ):
         """Controller to orchestrate daily filings fetching and alerts."""
         self.funds_csv_path = funds_csv_path
         self.start_date = start_date
         self.end_date = end_date
         self.tracker = FilingTracker(log_path)
+        # One pooled session shared by every fetcher and the alerter
+        self.session = build_session(pool_maxsize=max(20, max_workers * 2))
         self.debug = debug
+        self.max_workers = max_workers
 
         # Load active entities
-        self.funds_df = pd.read_csv(self.funds_csv_path, dtype=str)
-        self.funds_df = self.funds_df[self.funds_df["active"].str.lower() == "true"]
+        self.funds_df = read_csv(
+            self.funds_csv_path,
+            str_columns=["cik", "fund_name", "active", "entity_type"],
+            usecols=["cik", "fund_name", "active", "entity_type"],
+        )
+        # Empty or unrecognized "active" cells count as inactive
+        self.funds_df = self.funds_df[
+            self.funds_df["active"].isin(["true", "True", "TRUE"])
+        ]
+
+        # (cik, name, entity_type) per active entity, reused by every daily run
+        if "entity_type" in self.funds_df.columns:
+            entity_types = self.funds_df["entity_type"].str.lower().tolist()
+        else:
+            entity_types = ["fund"] * len(self.funds_df)
+        self._entities: List[Tuple[str, str, str]] = list(
+            zip(
+                self.funds_df["cik"].tolist(),
+                self.funds_df["fund_name"].tolist(),
+                entity_types,
+            )
+        )
 
         # Initialize Telegram alerter
         self.alerter = TelegramAlerter(
-            bot_token=telegram_bot_token, chat_id=telegram_chat_id
+            bot_token=telegram_bot_token,
+            chat_id=telegram_chat_id,
+            session=self.session,
         )
 
+        # Alerts are posted by a background sender so SEC fetching never waits on Telegram
+        self._alert_queue: "queue.Queue[str]" = queue.Queue()
+        self._alert_limiter = RateLimiter(rate=30, period=1.0)  # Telegram bot cap
+        threading.Thread(target=self._alert_worker, daemon=True).start()
+
         if self.debug:
             log_info(
                 "Controller :: DEBUG MODE ENABLED — No skipping of old or processed filings.\n"
@@ -53,19 +95,98 @@ class Controller:
 
         log_info("Controller :: Initiated successfully")
 
+    def _send_alert(self, msg: str):
+        """Queue a Telegram post; delivered in order by `_alert_worker`."""
+        self._alert_queue.put(msg)
+
+    def _alert_worker(self):
+        carry = None  # Alert that did not fit in the previous batch
+        while True:
+            batch = [carry if carry is not None else self._alert_queue.get()]
+            carry = None
+            length = len(batch[0])
+
+            # Coalesce alerts already waiting into one post, up to Telegram's limit
+            while True:
+                try:
+                    msg = self._alert_queue.get_nowait()
+                except queue.Empty:
+                    break
+                length += len(self.ALERT_SEPARATOR) + len(msg)
+                if length > self.ALERT_MAX_LENGTH:
+                    carry = msg
+                    break
+                batch.append(msg)
+
+            try:
+                self._alert_limiter.acquire()
+                sent = self.alerter.send_message(self.ALERT_SEPARATOR.join(batch))
+                # A rejected combined post must not take the other alerts down with it
+                if not sent and len(batch) > 1:
+                    log_error(
+                        f"Controller :: Combined alert rejected, resending {len(batch)} alerts one by one"
+                    )
+                    for msg in batch:
+                        self._alert_limiter.acquire()
+                        self.alerter.send_message(msg)
+            except Exception as e:
+                log_error(f"Controller :: Failed to send alert: {e}")
+            finally:
+                for _ in batch:
+                    self._alert_queue.task_done()
+
+    @staticmethod
+    def _append_holdings(
+        msg_parts: List[str], log_parts: List[str], holdings: pd.DataFrame
+    ):
+        """Append one line per holding to the Telegram and log message parts."""
+        # Convert reported value (in thousands) to actual dollars
+        values_usd = holdings["value_usd"].astype(np.float64) / 1000.0
+
+        # Format every line column-wise; the Telegram copy gets an HTML-escaped issuer
+        issuers = holdings["issuer"].astype(str)
+        details = (
+            " — "
+            + holdings["shares"].map("{:,}".format)
+            + " shares ($"
+            + values_usd.map("{:,.0f}".format)
+            + ")\n"
+        )
+        msg_parts.extend(
+            ("• " + issuers.map(TelegramAlerter.escape_html) + details).tolist()
+        )
+        log_parts.extend(("+ " + issuers + details).tolist())
+
     # ─────────────────────────────────────────────
     # Process Form 13F — institutional holdings
     # ─────────────────────────────────────────────
-    def process_fund(self, cik: str, fund_name: str):
+    def process_fund(self, cik: str, fund_name: str, today: Optional[date] = None):
         """Handle Form 13F filings (fund holdings updates)."""
+        today = today or date.today()
         try:
+            # Cheap freshness check on the submissions JSON before downloading filings
+            if not self.debug:
+                fetcher = FilingsFetcher(cik, session=self.session)
+                latest_13f_date = fetcher.latest_form_date("13F-HR")
+                if (
+                    latest_13f_date
+                    and (today - date.fromisoformat(latest_13f_date)).days > 1
+                ):
+                    log_info(
+                        f"Skipping {fund_name} — filing too old ({latest_13f_date})."
+                    )
+                    return
+
             comparator = Form13FComparator(
-                cik, start_date=self.start_date, end_date=self.end_date
+                cik,
+                start_date=self.start_date,
+                end_date=self.end_date,
+                session=self.session,
             )
             results = comparator.compare_filings()
 
             latest_date_str = results["latest_date"]
-            latest_date = datetime.strptime(latest_date_str, "%Y-%m-%d")
+            latest_date = date.fromisoformat(latest_date_str)
             accession_number = getattr(comparator, "latest_accession", "unknown")
 
             # Skip if already processed (unless debug mode)
@@ -78,258 +199,292 @@ class Controller:
                 return
 
             # Skip old filings (>1 day)
-            if not self.debug and (datetime.now().date() - latest_date.date()).days > 1:
+            if not self.debug and (today - latest_date).days > 1:
                 log_info(f"Skipping {fund_name} — filing too old ({latest_date_str}).")
                 return
 
-            msg = (
-                f"<b>📊 13F Update for {fund_name}</b>\n"
+            msg_parts = [
+                f"<b>📊 13F Update for {TelegramAlerter.escape_html(fund_name)}</b>\n"
                 f"<b>Comparing:</b> {results['previous_date']} → {results['latest_date']}\n\n"
-            )
-            log_msg = (
+            ]
+            log_parts = [
                 f"13F Update for {fund_name}\n"
                 f"Comparing: {results['previous_date']} -> {results['latest_date']}\n\n"
-            )
-
-            new_buys = results["new_buys"].copy()
-            exits = results["exits"].copy()
+            ]
 
-            # Convert reported value (in thousands) to actual dollars
-            if "value_usd" in new_buys.columns:
-                new_buys["value_usd"] = new_buys["value_usd"].astype(float) / 1000
-            if "value_usd" in exits.columns:
-                exits["value_usd"] = exits["value_usd"].astype(float) / 1000
+            new_buys = results["new_buys"]
+            exits = results["exits"]
 
             # 🟢 New buys
             if not new_buys.empty:
-                msg += f"<b>🟢 New Buys ({len(new_buys)})</b>\n"
-                log_msg += f"New Buys ({len(new_buys)})\n"
-
-                for _, row in new_buys.iterrows():
-                    issuer = row.get("issuer", "Unknown")
-                    value_usd = row.get("value_usd", 0.0)
-                    shares = row.get("shares", 0)
-
-                    msg += f"• {issuer} — {shares:,} shares (${value_usd:,.0f})\n"
-                    log_msg += f"+ {issuer} — {shares:,} shares (${value_usd:,.0f})\n"
+                msg_parts.append(f"<b>🟢 New Buys ({len(new_buys)})</b>\n")
+                log_parts.append(f"New Buys ({len(new_buys)})\n")
+                self._append_holdings(msg_parts, log_parts, new_buys)
 
             # ❌ Exits
             if not exits.empty:
-                msg += f"\n<b>❌ Exits ({len(exits)})</b>\n"
-                log_msg += f"\nExits ({len(exits)})\n"
-
-                for _, row in exits.iterrows():
-                    issuer = row.get("issuer", "Unknown")
-                    value_usd = row.get("value_usd", 0.0)
-                    shares = row.get("shares", 0)
-
-                    msg += f"• {issuer} — {shares:,} shares (${value_usd:,.0f})\n"
-                    log_msg += f"+ {issuer} — {shares:,} shares (${value_usd:,.0f})\n"
+                msg_parts.append(f"\n<b>❌ Exits ({len(exits)})</b>\n")
+                log_parts.append(f"\nExits ({len(exits)})\n")
+                self._append_holdings(msg_parts, log_parts, exits)
 
             # No changes
             if new_buys.empty and exits.empty:
-                msg += "<i>No new buys or exits detected.</i>\n"
-                log_msg += "No new buys or exits detected.\n"
+                msg_parts.append("<i>No new buys or exits detected.</i>\n")
+                log_parts.append("No new buys or exits detected.\n")
+
+            msg_parts.append("\n<i>🕒 Automated scan completed.</i>")
+            log_parts.append("\nAutomated scan completed.")
 
-            msg += "\n<i>🕒 Automated scan completed.</i>"
-            log_msg += "\nAutomated scan completed."
+            msg = "".join(msg_parts)
+            log_msg = "".join(log_parts)
 
-            log_debug(f"Controller :: Sending the following message: {msg}")
+            log_debug("Controller :: Sending the following message: %s", msg)
             log_info(f"Controller :: process_fund: {log_msg}")
 
-            self.alerter.send_message(msg)
+            self._send_alert(msg)
             self.tracker.log_filing(cik, "13F-HR", accession_number, latest_date_str)
 
         except Exception as e:
             err_msg = f"Error processing {fund_name} (CIK {cik}): {e}"
             log_error(f"Controller :: {err_msg}")
-            self.alerter.send_message(f"<b>{err_msg}</b>")
+            self._send_alert(f"<b>{TelegramAlerter.escape_html(err_msg)}</b>")
 
     # ─────────────────────────────────────────────
     # Process Forms 4 and 144 — insider trades
     # ─────────────────────────────────────────────
     def process_company(
-        self, cik: str, company_name: str, process_form_144: bool = True
+        self,
+        cik: str,
+        company_name: str,
+        process_form_144: bool = True,
+        today: Optional[date] = None,
     ):
+        today = pd.Timestamp(today or date.today())
+        company_html = TelegramAlerter.escape_html(company_name)
         try:
-            fetcher = FilingsFetcher(cik)
-
-            for form_type in ["4", "144"]:
-                filings = fetcher.get_recent_filings(form_type, count=5)
-
-                for filing in filings:
-                    accession = filing["accession"]
-                    filing_date = filing["filing_date"]
+            fetcher = FilingsFetcher(cik, session=self.session)
+            # Form 144 filings are neither fetched nor logged unless they will be parsed
+            form_types = ["4", "144"] if process_form_144 else ["4"]
+
+            # Select the filings to process from the submissions JSON alone
+            selected = []
+            for form_type in form_types:
+                filings = fetcher.list_recent_filings(form_type, count=5)
+                if not filings:
+                    continue
+
+                # Parse all filing dates at once and flag the recent ones (<= 1 day)
+                filing_dates = pd.to_datetime(
+                    [f["filing_date"] for f in filings], format="%Y-%m-%d", cache=True
+                )
+                fresh_mask = np.asarray((today - filing_dates.normalize()).days <= 1)
+                new_mask = np.array(
+                    [
+                        self.tracker.is_new_filing(cik, form_type, f["accession"])
+                        for f in filings
+                    ],
+                    dtype=bool,
+                )
 
-                    # Skip already processed
-                    if not self.debug and not self.tracker.is_new_filing(
-                        cik, form_type, accession
-                    ):
+                # Decide which filings to parse before doing any per-filing work
+                if not self.debug:
+                    for filing in compress(filings, ~new_mask):
                         log_info(
-                            f"Controller :: Skipping {accession} ({cik}) — already processed this filing."
+                            f"Controller :: Skipping {filing['accession']} ({cik}) — already processed this filing."
                         )
-                        continue
-
-                    # Skip old filings (>1 day)
-                    date_obj = datetime.strptime(filing_date, "%Y-%m-%d")
-                    if (
-                        not self.debug
-                        and (datetime.now().date() - date_obj.date()).days > 1
-                    ):
+                    for filing in compress(filings, new_mask & ~fresh_mask):
                         log_info(
-                            f"Controller :: Skipping {accession} ({cik}) — filling is too old. (> 1 day)"
+                            f"Controller :: Skipping {filing['accession']} ({cik}) — filling is too old. (> 1 day)"
                         )
-                        continue
-
-                    # Handle Form 4 filings — aggregate trades
-                    if form_type == "4":
-                        df = fetcher.parse_form4(filing)
-                        if not df.empty:
-                            # Normalize column names — different XMLs sometimes vary
-                            df.columns = [c.lower().strip() for c in df.columns]
-
-                            # Try to locate security title column
-                            possible_cols = [
-                                "securitytitle",
-                                "security_title",
-                                "issuer",
-                                "name",
-                            ]
-                            sec_col = next(
-                                (c for c in possible_cols if c in df.columns), None
+                    filings = list(compress(filings, new_mask & fresh_mask))
+
+                selected.extend(filings)
+
+            # Only the filings that will be parsed get their index fetched
+            for filing in fetcher.fetch_indexes(selected):
+                form_type = filing["form_type"]
+                accession = filing["accession"]
+                filing_date = filing["filing_date"]
+
+                # Handle Form 4 filings — aggregate trades
+                if form_type == "4":
+                    df = fetcher.parse_form4(filing)
+                    if not df.empty:
+                        # Normalize column names (different XMLs sometimes vary)
+                        # and coerce the numeric fields in a single pass
+                        df = (
+                            df.rename(columns=lambda c: c.lower().strip())
+                            .assign(
+                                shares=lambda d: pd.to_numeric(
+                                    d.get("shares"), errors="coerce"
+                                ),
+                                price=lambda d: pd.to_numeric(
+                                    d.get("price"), errors="coerce"
+                                ),
+                                notional=lambda d: d["shares"] * d["price"],
                             )
-                            if sec_col is None:
-                                raise KeyError(
-                                    "No column describing the traded security found."
-                                )
+                            .dropna(subset=["shares", "price"])
+                        )
 
-                            df["shares"] = pd.to_numeric(
-                                df.get("shares"), errors="coerce"
-                            )
-                            df["price"] = pd.to_numeric(
-                                df.get("price"), errors="coerce"
+                        # Try to locate security title column
+                        possible_cols = [
+                            "securitytitle",
+                            "security_title",
+                            "issuer",
+                            "name",
+                        ]
+                        sec_col = next(
+                            (c for c in possible_cols if c in df.columns), None
+                        )
+                        if sec_col is None:
+                            raise KeyError(
+                                "No column describing the traded security found."
                             )
 
-                            # Aggregate total shares and weighted avg price per security
-                            grouped = (
-                                df.dropna(subset=["shares", "price"])
-                                .groupby(sec_col)
-                                .apply(
-                                    lambda g: pd.Series(
-                                        {
-                                            "total_shares": g["shares"].sum(),
-                                            "avg_price": (
-                                                g["shares"] * g["price"]
-                                            ).sum()
-                                            / g["shares"].sum(),
-                                        }
-                                    ),
-                                    include_groups=False,  # needed for newer versions of pandas
-                                )
-                                .reset_index()
-                                .rename(columns={sec_col: "security"})
+                        # Aggregate total shares and weighted avg price per security
+                        grouped = df.groupby(sec_col).agg(
+                            total_shares=("shares", "sum"),
+                            notional=("notional", "sum"),
+                        )
+                        grouped["avg_price"] = (
+                            grouped["notional"] / grouped["total_shares"]
+                        )
+                        grouped = grouped.reset_index().rename(
+                            columns={sec_col: "security"}
+                        )
+
+                        # Filter to show only external securities (different from company)
+                        own_stock = grouped["security"].str.contains(
+                            company_name, case=False, regex=False, na=False
+                        )
+                        grouped = grouped[~own_stock]
+
+                        # If all trades are internal (own stock), still display a summary
+                        msg_parts = [
+                            f"<b>🧾 Form 4 — Insider Trades</b>\n"
+                            f"<b>🏢 {company_html}</b>\n"
+                            f"<b>📅 {filing_date}</b>\n\n"
+                        ]
+                        log_parts = [
+                            f"Form 4 — Insider Trades\n"
+                            f"{company_name}\n"
+                            f"{filing_date}\n\n"
+                        ]
+
+                        if grouped.empty:
+                            total_shares = int(df["shares"].sum())
+                            avg_price = df["notional"].sum() / df["shares"].sum()
+                            msg_parts.append(
+                                f"• <b>Own stock:</b> {total_shares:,} shares @ ${avg_price:.2f}\n"
+                                f"<i>(All trades were for {company_html}'s own stock.)</i>"
+                            )
+                            log_parts.append(
+                                f"+ Own stock: {total_shares:,} shares @ ${avg_price:.2f}\n"
+                                f"(All trades were for {company_name}'s own stock.)"
                             )
 
-                            # Filter to show only external securities (different from company)
-                            grouped = grouped[
-                                grouped["security"]
-                                .str.lower()
-                                .str.contains(company_name.lower())
-                                == False
-                            ]
-
-                            # If all trades are internal (own stock), still display a summary
-                            msg = (
-                                f"<b>🧾 Form 4 — Insider Trades</b>\n"
-                                f"<b>🏢 {company_name}</b>\n"
-                                f"<b>📅 {filing_date}</b>\n\n"
+                        else:
+                            security = grouped["security"].astype(str)
+                            trades = (
+                                ": "
+                                + grouped["total_shares"]
+                                .astype("int64")
+                                .map("{:,}".format)
+                                + " shares @ $"
+                                + grouped["avg_price"].map("{:.2f}".format)
+                                + "\n"
                             )
-                            log_msg = (
-                                f"Form 4 — Insider Trades\n"
-                                f"{company_name}\n"
-                                f"{filing_date}\n\n"
+                            security_html = security.map(TelegramAlerter.escape_html)
+                            msg_parts.extend(
+                                ("• <b>" + security_html + "</b>" + trades).tolist()
                             )
+                            log_parts.extend(("+ " + security + trades).tolist())
 
-                            if grouped.empty:
-                                total_shares = int(df["shares"].sum())
-                                avg_price = (df["shares"] * df["price"]).sum() / df[
-                                    "shares"
-                                ].sum()
-                                msg += (
-                                    f"• <b>Own stock:</b> {total_shares:,} shares @ ${avg_price:.2f}\n"
-                                    f"<i>(All trades were for {company_name}'s own stock.)</i>"
-                                )
-                                log_msg += (
-                                    f"+ Own stock: {total_shares:,} shares @ ${avg_price:.2f}\n"
-                                    f"(All trades were for {company_name}'s own stock.)"
-                                )
-
-                            else:
-                                for _, row in grouped.iterrows():
-                                    msg += (
-                                        f"• <b>{row['security']}</b>: "
-                                        f"{int(row['total_shares']):,} shares "
-                                        f"@ ${row['avg_price']:.2f}\n"
-                                    )
-                                    log_msg += (
-                                        f"+ {row['security']}: "
-                                        f"{int(row['total_shares']):,} shares "
-                                        f"@ ${row['avg_price']:.2f}\n"
-                                    )
-
-                            log_debug(f"Controller :: Sending the following message: ")
-                            log_info(f"Controller :: process_company: {log_msg}")
-                            self.alerter.send_message(msg)
-
-                    # Handle Form 144 filings — simpler link alert
-                    elif form_type == "144" and process_form_144:
-                        df = fetcher.parse_form144(filing)
-                        msg = (
-                            f"<b>📜 Form 144 — Insider Sale Notice</b>\n"
-                            f"<b>🏢 {company_name}</b>\n"
-                            f"<b>📅 {filing_date}</b>\n"
-                            f"🔗 <a href='{df['filing_url'].iloc[0]}'>View filing</a>"
-                        )
-                        log_msg = (
-                            f"Form 144 — Insider Sale Notice\n"
-                            f"{company_name}\n"
-                            f"{filing_date}\n"
-                            f"'{df['filing_url'].iloc[0]}'"
-                        )
+                        msg = "".join(msg_parts)
+                        log_msg = "".join(log_parts)
 
-                        log_debug(f"Controller :: Sending the following message:")
+                        log_debug(
+                            "Controller :: Sending the following message: %s", msg
+                        )
                         log_info(f"Controller :: process_company: {log_msg}")
-                        self.alerter.send_message(msg)
-
-                    # Log after successful alert
-                    self.tracker.log_filing(cik, form_type, accession, filing_date)
+                        self._send_alert(msg)
+
+                # Handle Form 144 filings — simpler link alert
+                elif form_type == "144":
+                    df = fetcher.parse_form144(filing)
+                    filing_url = df["filing_url"].iloc[0]
+                    msg = (
+                        f"<b>📜 Form 144 — Insider Sale Notice</b>\n"
+                        f"<b>🏢 {company_html}</b>\n"
+                        f"<b>📅 {filing_date}</b>\n"
+                        f"🔗 <a href='{TelegramAlerter.escape_html(filing_url)}'>View filing</a>"
+                    )
+                    log_msg = (
+                        f"Form 144 — Insider Sale Notice\n"
+                        f"{company_name}\n"
+                        f"{filing_date}\n"
+                        f"'{filing_url}'"
+                    )
+
+                    log_debug("Controller :: Sending the following message: %s", msg)
+                    log_info(f"Controller :: process_company: {log_msg}")
+                    self._send_alert(msg)
+
+                # Log after successful alert
+                self.tracker.log_filing(cik, form_type, accession, filing_date)
 
         except Exception as e:
             err_msg = f"⚠️ Error processing {company_name} (CIK {cik}): {e}"
             log_error(f"Controller :: {err_msg}")
-            self.alerter.send_message(f"<b>{err_msg}</b>")
+            self._send_alert(f"<b>{TelegramAlerter.escape_html(err_msg)}</b>")
 
     # ─────────────────────────────────────────────
     # Main runner
     # ─────────────────────────────────────────────
     def run_daily_check(self, process_form_144: bool = False):
+        started_at = datetime.now()
+        # One reference date for every filing age check in this run
+        today = started_at.date()
         log_info(
-            f"Controller :: Starting daily filings check — {datetime.now():%Y-%m-%d %H:%M:%S}"
+            f"Controller :: Starting daily filings check — {started_at:%Y-%m-%d %H:%M:%S}"
         )
-        for _, row in self.funds_df.iterrows():
-            cik = row["cik"]
-            name = row["fund_name"]
-            entity_type = row.get("entity_type", "fund").lower()
-
-            log_info(f"Controller :: Checking {name} ({cik}) as {entity_type}...")
-            if entity_type == "fund":
-                self.process_fund(cik, name)
-            elif entity_type == "company":
-                self.process_company(cik, name, process_form_144=process_form_144)
-
-            # Avoid hammering SEC API
-            time.sleep(15)
-        log_info("Controller :: Daily check completed.")
+        # SEC requests are throttled by the shared rate limiter
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self._process_entity,
+                    cik,
+                    name,
+                    entity_type,
+                    process_form_144,
+                    today,
+                )
+                for cik, name, entity_type in self._entities
+            ]
+            for future in futures:
+                future.result()
+
+        # Make sure this run's alerts are out before reporting completion
+        self._alert_queue.join()
+
+        elapsed = (datetime.now() - started_at).total_seconds()
+        log_info(f"Controller :: Daily check completed in {elapsed:.1f}s.")
+
+    def _process_entity(
+        self,
+        cik: str,
+        name: str,
+        entity_type: str,
+        process_form_144: bool,
+        today: date,
+    ):
+        log_info(f"Controller :: Checking {name} ({cik}) as {entity_type}...")
+        if entity_type == "fund":
+            self.process_fund(cik, name, today=today)
+        elif entity_type == "company":
+            self.process_company(
+                cik, name, process_form_144=process_form_144, today=today
+            )
 
 
 # ─────────────────────────────────────────────
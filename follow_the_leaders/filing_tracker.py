@@ -1,40 +1,36 @@
+import csv
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
+from typing import Set, Tuple
+import threading
 
 from follow_the_leaders._logger import log_debug
 
 
 class FilingTracker:
+    COLUMNS = ["cik", "form_type", "accession_number", "filing_date", "processed_at"]
+
     def __init__(self, log_path: str | Path = "data/processed_filings.csv"):
         self.log_path = Path(log_path)
         self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
 
+        # In-memory index of processed filings for O(1) lookups
+        self._seen: Set[Tuple[str, str, str]] = set()
         if self.log_path.exists():
-            self.df = pd.read_csv(self.log_path, dtype=str)
-        else:
-            self.df = pd.DataFrame(
-                columns=[
-                    "cik",
-                    "form_type",
-                    "accession_number",
-                    "filing_date",
-                    "processed_at",
-                ]
-            )
+            df = pd.read_csv(self.log_path, dtype=str)
+            self._seen.update(zip(df["cik"], df["form_type"], df["accession_number"]))
 
     def is_new_filing(self, cik: str, form_type: str, accession_number: str) -> bool:
         """Check if a filing has already been processed."""
-        match = (
-            (self.df["cik"] == cik)
-            & (self.df["form_type"] == form_type)
-            & (self.df["accession_number"] == accession_number)
-        )
-
-        response = not match.any()
+        response = (cik, form_type, accession_number) not in self._seen
 
         log_debug(
-            f"FilingTracker :: Is the filing {accession_number} of CIK {cik} new? {response}"
+            "FilingTracker :: Is the filing %s of CIK %s new? %s",
+            accession_number,
+            cik,
+            response,
         )
 
         return response
@@ -42,16 +38,25 @@ class FilingTracker:
     def log_filing(
         self, cik: str, form_type: str, accession_number: str, filing_date: str
     ):
-        """Record a new filing as processed."""
-        new_entry = {
-            "cik": cik,
-            "form_type": form_type,
-            "accession_number": accession_number,
-            "filing_date": filing_date,
-            "processed_at": datetime.now().isoformat(timespec="seconds"),
-        }
-
-        self.df = pd.concat([self.df, pd.DataFrame([new_entry])], ignore_index=True)
-        self.df.to_csv(self.log_path, index=False)
-
-        log_debug(f"FilingTracker :: The following filing has been logged: {new_entry}")
+        """Record a new filing as processed (appends a single row to the log)."""
+        new_entry = [
+            cik,
+            form_type,
+            accession_number,
+            filing_date,
+            datetime.now().isoformat(timespec="seconds"),
+        ]
+
+        with self._lock:
+            self._seen.add((cik, form_type, accession_number))
+
+            write_header = not self.log_path.exists()
+            with open(self.log_path, "a", newline="") as f:
+                writer = csv.writer(f)
+                if write_header:
+                    writer.writerow(self.COLUMNS)
+                writer.writerow(new_entry)
+
+        log_debug(
+            "FilingTracker :: The following filing has been logged: %s", new_entry
+        )
@@ -1,14 +1,19 @@
 import requests
 import pandas as pd
-from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
-import json
-import hashlib
+import numpy as np
+from lxml import etree
+from typing import List, Dict, Optional, Tuple
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
+import zstandard
 
 from follow_the_leaders.secret_vars import SEC_HEADERS
-from follow_the_leaders._logger import log_debug, log_info, log_error
+from follow_the_leaders._logger import log_debug, log_info
+from follow_the_leaders._http import sec_get
+from follow_the_leaders import _json
 
 
 class FilingsFetcher:
@@ -22,152 +27,258 @@ class FilingsFetcher:
     CACHE_DIR = Path("data/cache")
     CACHE_TTL_HOURS = 12  # Re-fetch every 12 hours
     PURGE_OLDER_THAN_DAYS = 7  # Remove cache files older than 7 days
-
-    def __init__(self, cik: str, cache_dir: str | Path = None):
+    PURGE_INTERVAL_HOURS = 24  # Scan the cache folder at most once a day
+    # Cache files written by this class and Form13FComparator
+    CACHE_PATTERNS = ("*_submissions.json*", "*_index.json", "*_infotable.*")
+    MEMORY_CACHE_TTL_SECONDS = 3600  # Reuse in-process submissions for 1 hour
+    INDEX_FETCH_WORKERS = 5  # Concurrent index.json downloads (still rate limited)
+
+    # In-process cache shared by all instances: cik -> (fetched_at, submissions)
+    _submissions_cache: Dict[str, Tuple[float, dict]] = {}
+    _purge_lock = threading.Lock()
+
+    def __init__(
+        self,
+        cik: str,
+        cache_dir: str | Path = None,
+        session: Optional[requests.Session] = None,
+    ):
         self.cik = cik.zfill(10)
+        self.session = session
         self.submissions: Optional[dict] = None
+        self._submissions_lock = threading.Lock()
         self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
         self._purge_old_cache_files()  # Clean old cache entries
 
     # ─────────────────────────────────────────────
     # Cache helpers
     # ─────────────────────────────────────────────
-    def _cache_path(self) -> Path:
-        hashed = hashlib.md5(self.cik.encode()).hexdigest()
-        return self.CACHE_DIR / f"{hashed}_submissions.json"
+    @classmethod
+    def _cache_path(cls, cik: str) -> Path:
+        return cls.CACHE_DIR / f"{cik}_submissions.json.zst"
 
-    def _load_cache(self) -> Optional[dict]:
-        path = self._cache_path()
+    @classmethod
+    def _load_cache(cls, cik: str) -> Optional[dict]:
+        path = cls._cache_path(cik)
         if not path.exists():
             return None
         try:
             mtime = datetime.fromtimestamp(path.stat().st_mtime)
-            if datetime.now() - mtime > timedelta(hours=self.CACHE_TTL_HOURS):
+            if datetime.now() - mtime > timedelta(hours=cls.CACHE_TTL_HOURS):
                 return None
-            with open(path, "r") as f:
-                return json.load(f)
+            raw = zstandard.ZstdDecompressor().decompress(path.read_bytes())
+            return _json.loads(raw)
         except Exception:
             return None
 
-    def _save_cache(self, data: dict) -> None:
-        with open(self._cache_path(), "w") as f:
-            json.dump(data, f)
+    @classmethod
+    def _save_cache(cls, cik: str, data: dict) -> None:
+        raw = zstandard.ZstdCompressor(level=3).compress(_json.dumps(data))
+        cls._cache_path(cik).write_bytes(raw)
 
     def _purge_old_cache_files(self):
-        """Delete cache files older than PURGE_OLDER_THAN_DAYS."""
+        """
+        Delete cache files older than PURGE_OLDER_THAN_DAYS.
+        A sentinel file limits the directory scan to once per PURGE_INTERVAL_HOURS.
+        """
+        sentinel = self.CACHE_DIR / ".last_purge"
         now = datetime.now()
-        removed = 0
-        for file in self.CACHE_DIR.glob("*_submissions.json"):
+
+        with self._purge_lock:
             try:
-                mtime = datetime.fromtimestamp(file.stat().st_mtime)
-                if now - mtime > timedelta(days=self.PURGE_OLDER_THAN_DAYS):
-                    file.unlink()
-                    removed += 1
-            except Exception:
-                continue
+                last_purge = datetime.fromtimestamp(sentinel.stat().st_mtime)
+                if now - last_purge < timedelta(hours=self.PURGE_INTERVAL_HOURS):
+                    return
+            except FileNotFoundError:
+                pass
+
+            removed = 0
+            for file in (
+                f
+                for pattern in self.CACHE_PATTERNS
+                for f in self.CACHE_DIR.glob(pattern)
+            ):
+                try:
+                    mtime = datetime.fromtimestamp(file.stat().st_mtime)
+                    if now - mtime > timedelta(days=self.PURGE_OLDER_THAN_DAYS):
+                        file.unlink()
+                        removed += 1
+                except Exception:
+                    continue
+            sentinel.touch()
+
         if removed > 0:
             log_info(f"FilingsFetcher :: Purged {removed} old cache file(s).")
 
     # ─────────────────────────────────────────────
     # SEC data fetch
     # ─────────────────────────────────────────────
+    @classmethod
+    def load_submissions(
+        cls, cik: str, session: Optional[requests.Session] = None
+    ) -> dict:
+        """
+        Submissions JSON of `cik`, shared in-process by every fetcher and comparator
+        and cached on disk for CACHE_TTL_HOURS.
+        """
+        cik = cik.zfill(10)
+        memory_cached = cls._submissions_cache.get(cik)
+        if (
+            memory_cached
+            and time.monotonic() - memory_cached[0] < cls.MEMORY_CACHE_TTL_SECONDS
+        ):
+            return memory_cached[1]
+
+        submissions = cls._load_cache(cik)
+        if not submissions:
+            log_info(f"FilingsFetcher :: Fetching fresh SEC data for CIK {cik}...")
+            r = sec_get(cls.BASE_URL.format(cik), session=session)
+            r.raise_for_status()
+            submissions = _json.loads(r.content)
+            cls.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            cls._save_cache(cik, submissions)
+
+        cls._submissions_cache[cik] = (time.monotonic(), submissions)
+        return submissions
+
+    @classmethod
+    def clear_submissions_cache(cls) -> None:
+        """Drop the in-process submissions (the on-disk cache is left alone)."""
+        cls._submissions_cache.clear()
+
     def _fetch_submissions(self) -> None:
-        cached = self._load_cache()
-        if cached:
-            self.submissions = cached
-            return
-
-        log_info(f"FilingsFetcher :: Fetching fresh SEC data for CIK {self.cik}...")
-        url = self.BASE_URL.format(self.cik)
-        r = requests.get(url, headers=self.SEC_HEADERS)
-        r.raise_for_status()
-        self.submissions = r.json()
-        self._save_cache(self.submissions)
+        self.submissions = self.load_submissions(self.cik, session=self.session)
 
     # ─────────────────────────────────────────────
     # Retrieve filings metadata
     # ─────────────────────────────────────────────
-    def get_recent_filings(self, form_type: str, count: int = 5) -> List[Dict]:
-        log_debug(f"FilingsFetcher :: Pulling the {count} most recent filings...")
-        if self.submissions is None:
-            self._fetch_submissions()
-
-        filings = []
-        recent = self.submissions["filings"]["recent"]
-
-        for i, f_type in enumerate(recent["form"]):
-            if f_type.upper() == form_type.upper():
-                accession = recent["accessionNumber"][i].replace("-", "")
-                filing_date = recent["filingDate"][i]
-                base_url = f"https://www.sec.gov/Archives/edgar/data/{int(self.cik)}/{accession}"
-                index_url = f"{base_url}/index.json"
+    def latest_form_date(self, form_type: str) -> Optional[str]:
+        """Filing date of the most recent `form_type` filing, without fetching any index."""
+        with self._submissions_lock:
+            if self.submissions is None:
+                self._fetch_submissions()
+
+        indices = self._form_indices(form_type)
+        if indices.size == 0:
+            return None
+        return self.submissions["filings"]["recent"]["filingDate"][indices[0]]
 
-                try:
-                    r = requests.get(index_url, headers=self.SEC_HEADERS)
-                    r.raise_for_status()
-                    files = r.json()["directory"]["item"]
-                except Exception:
-                    files = []
+    def _form_indices(self, form_type: str) -> np.ndarray:
+        """Positions of `form_type` filings (any case) in the recent submissions, newest first."""
+        forms = np.asarray(self.submissions["filings"]["recent"]["form"], dtype=str)
+        return np.flatnonzero(np.char.upper(forms) == form_type.upper())
 
-                filings.append(
-                    {
-                        "accession": accession,
-                        "filing_date": filing_date,
-                        "base_url": base_url,
-                        "files": files,
-                    }
-                )
+    def _fetch_index(self, base_url: str) -> List[Dict]:
+        """File listing of a filing folder."""
+        r = sec_get(f"{base_url}/index.json", session=self.session)
+        r.raise_for_status()
+        return _json.loads(r.content)["directory"]["item"]
+
+    def list_recent_filings(self, form_type: str, count: int = 5) -> List[Dict]:
+        """
+        The `count` most recent `form_type` filings (possibly none), read from the
+        submissions JSON only. Use `fetch_indexes` to add their file listings.
+        """
+        log_debug("FilingsFetcher :: Pulling the %d most recent filings...", count)
+        with self._submissions_lock:
+            if self.submissions is None:
+                self._fetch_submissions()
 
-                if len(filings) >= count:
-                    break
+        filings = []
+        recent = self.submissions["filings"]["recent"]
+        for i in self._form_indices(form_type)[:count]:
+            accession = recent["accessionNumber"][i].replace("-", "")
+            filings.append(
+                {
+                    "accession": accession,
+                    "form_type": form_type,
+                    "filing_date": recent["filingDate"][i],
+                    "base_url": f"https://www.sec.gov/Archives/edgar/data/{int(self.cik)}/{accession}",
+                }
+            )
 
         if not filings:
-            log_error(
-                f"FilingsFetcher :: No filings found for {form_type} (CIK {self.cik})"
+            log_debug(
+                "FilingsFetcher :: No filings found for %s (CIK %s)",
+                form_type,
+                self.cik,
             )
-            raise ValueError(f"No filings found for {form_type} (CIK {self.cik})")
 
         return filings
 
+    def fetch_indexes(self, filings: List[Dict]) -> List[Dict]:
+        """
+        Download the file listings of `filings` concurrently (adds a "files" key).
+        A failed download raises, so the caller reports it instead of losing the filing.
+        """
+        if not filings:
+            return []
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.INDEX_FETCH_WORKERS, len(filings))
+        ) as executor:
+            indexes = executor.map(self._fetch_index, [f["base_url"] for f in filings])
+            for filing, files in zip(filings, indexes):
+                filing["files"] = files
+        return filings
+
+    def get_recent_filings(self, form_type: str, count: int = 5) -> List[Dict]:
+        """The `count` most recent `form_type` filings, with their file listings."""
+        return self.fetch_indexes(self.list_recent_filings(form_type, count=count))
+
     # ─────────────────────────────────────────────
     # XML helper
     # ─────────────────────────────────────────────
     @staticmethod
-    def _find_text(soup, tag_name: str) -> Optional[str]:
-        tag = soup.find(tag_name)
-        return tag.text.strip() if tag else None
+    def _find_text(node: etree._Element, tag_name: str) -> Optional[str]:
+        """Text of the first descendant named `tag_name` (any namespace)."""
+        tag = node.find(f".//{{*}}{tag_name}")
+        return "".join(tag.itertext()).strip() if tag is not None else None
+
+    @staticmethod
+    def _first_with_suffix(files: List[Dict], suffix: str) -> Optional[Dict]:
+        """First file of an index listing ending in `suffix` (any case)."""
+        n = len(suffix)
+        return next((f for f in files if f["name"][-n:].lower() == suffix), None)
 
     # ─────────────────────────────────────────────
     # Parse Form 4 (insider trades)
     # ─────────────────────────────────────────────
     def parse_form4(self, filing: Dict) -> pd.DataFrame:
-        xml_file = next(
-            (f for f in filing["files"] if f["name"].lower().endswith(".xml")), None
-        )
+        xml_file = self._first_with_suffix(filing["files"], ".xml")
         if not xml_file:
             raise ValueError("No XML file found for Form 4.")
 
         url = f"{filing['base_url']}/{xml_file['name']}"
-        r = requests.get(url, headers=self.SEC_HEADERS)
+        r = sec_get(url, session=self.session)
         r.raise_for_status()
-        soup = BeautifulSoup(r.text, "xml")
+        root = etree.fromstring(r.content)
+
+        insider_name = self._find_text(root, "rptOwnerName")
+        issuer_name = self._find_text(root, "issuerName")
 
-        insider_name = self._find_text(soup, "rptOwnerName")
-        issuer_name = self._find_text(soup, "issuerName")
+        # Collect each field column-wise, then build the DataFrame once
+        dates, codes, shares, prices = [], [], [], []
+        for trans in root.iter("{*}nonDerivativeTransaction"):
+            dates.append(self._find_text(trans, "transactionDate"))
+            codes.append(self._find_text(trans, "transactionCode"))
+            shares.append(self._find_text(trans, "transactionShares"))
+            prices.append(self._find_text(trans, "transactionPricePerShare"))
 
-        trades = []
-        for trans in soup.find_all("nonDerivativeTransaction"):
-            trade = {
+        df = pd.DataFrame(
+            {
                 "issuer": issuer_name,
                 "insider": insider_name,
-                "transaction_date": self._find_text(trans, "transactionDate"),
-                "transaction_code": self._find_text(trans, "transactionCode"),
-                "shares": self._find_text(trans, "transactionShares"),
-                "price": self._find_text(trans, "transactionPricePerShare"),
+                "transaction_date": dates,
+                "transaction_code": codes,
+                "shares": pd.to_numeric(
+                    pd.Series(shares, dtype=object), errors="coerce"
+                ),
+                "price": pd.to_numeric(
+                    pd.Series(prices, dtype=object), errors="coerce"
+                ),
             }
-            trades.append(trade)
-
-        df = pd.DataFrame(trades)
+        )
         df["filing_date"] = filing["filing_date"]
         df["form_type"] = "4"
         return df
@@ -176,14 +287,12 @@ class FilingsFetcher:
     # Parse Form 144 (insider sales)
     # ─────────────────────────────────────────────
     def parse_form144(self, filing: Dict) -> pd.DataFrame:
-        txt_file = next(
-            (f for f in filing["files"] if f["name"].lower().endswith(".txt")), None
-        )
+        txt_file = self._first_with_suffix(filing["files"], ".txt")
         if not txt_file:
             raise ValueError("No .txt file found for Form 144.")
 
         url = f"{filing['base_url']}/{txt_file['name']}"
-        r = requests.get(url, headers=self.SEC_HEADERS)
+        r = sec_get(url, session=self.session)
         r.raise_for_status()
 
         text = r.text
@@ -1,64 +1,122 @@
 import requests
 import pandas as pd
-from bs4 import BeautifulSoup
+import numpy as np
+import io
+from lxml import etree
 from typing import List, Tuple, Dict, Optional
-from datetime import datetime
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
-from follow_the_leaders.secret_vars import SEC_HEADERS
+from follow_the_leaders._http import sec_get
+from follow_the_leaders.filings_fetcher import FilingsFetcher
+from follow_the_leaders import _json
 
 
 class Form13FComparator:
-    BASE_URL = "https://data.sec.gov/submissions/CIK{}.json"
-    SEC_HEADERS = SEC_HEADERS
+    # Shares the cache folder (and its purging) with FilingsFetcher
+    CACHE_DIR = Path("data/cache")
+    INDEX_CACHE_TTL_HOURS = 12
+    # Parsed holdings are keyed by accession number: filings never change once published
+    INFOTABLE_CACHE_SUFFIX = "parquet"
 
     def __init__(
         self,
         cik: str,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
+        session: Optional[requests.Session] = None,
     ):
         self.cik = cik.zfill(10)
         self.submissions = None
+        self.session = session
 
         self.start_date = start_date
         self.end_date = end_date
+        self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
     def _fetch_submissions(self) -> None:
-        url = self.BASE_URL.format(self.cik)
-        r = requests.get(url, headers=self.SEC_HEADERS)
+        self.submissions = FilingsFetcher.load_submissions(
+            self.cik, session=self.session
+        )
+
+    # ─────────────────────────────────────────────
+    # Cache helpers
+    # ─────────────────────────────────────────────
+    def _fetch_index(self, base_url: str, accession: str) -> List[Dict]:
+        """File listing of a filing folder, cached on disk for INDEX_CACHE_TTL_HOURS."""
+        path = self.CACHE_DIR / f"{accession}_index.json"
+        try:
+            mtime = datetime.fromtimestamp(path.stat().st_mtime)
+            if datetime.now() - mtime <= timedelta(hours=self.INDEX_CACHE_TTL_HOURS):
+                return _json.loads(path.read_bytes())
+        except Exception:
+            pass
+
+        r = sec_get(f"{base_url}/index.json", session=self.session)
         r.raise_for_status()
-        self.submissions = r.json()
+        files = _json.loads(r.content)["directory"]["item"]
+        path.write_bytes(_json.dumps(files))
+        return files
+
+    def _load_infotable(self, url: str, accession: str) -> pd.DataFrame:
+        """Parsed holdings of a filing, downloaded only on a cache miss."""
+        path = self.CACHE_DIR / f"{accession}_infotable.{self.INFOTABLE_CACHE_SUFFIX}"
+        if path.exists():
+            try:
+                return pd.read_parquet(path)
+            except Exception:
+                pass
+
+        r = sec_get(url, session=self.session)
+        r.raise_for_status()
+        df = self._parse_xml(r.content)
+        df.to_parquet(path, compression="zstd")
+        return df
+
+    @staticmethod
+    def _info_table_name(files: List[Dict]) -> Optional[str]:
+        """Name of the infoTable XML in a filing's index listing, if any."""
+        for f in files:
+            name = f["name"]
+            # Cheap suffix test first; lowercase the full name only for XML files
+            if name[-4:].lower() == ".xml" and "info" in name.lower():
+                return name
+        return None
 
     def _get_recent_13f_urls(self, count=2) -> List:
-        """Return URLs to the infoTable XMLs for the most recent filings."""
+        """Return (url, filing_date, accession) of the infoTable XMLs for the most recent filings."""
         if self.submissions is None:
             self._fetch_submissions()
 
         forms = self.submissions["filings"]["recent"]
-        urls = []
-        for i, form in enumerate(forms["form"]):
-            if form == "13F-HR":
-                accession = forms["accessionNumber"][i].replace("-", "")
-                filing_date = forms["filingDate"][i]
-
-                filing_dt = datetime.strptime(filing_date, "%Y-%m-%d")
-                if self.start_date and filing_dt < self.start_date:
-                    continue
-                if self.end_date and filing_dt > self.end_date:
-                    continue
-
-                base_url = f"https://www.sec.gov/Archives/edgar/data/{int(self.cik)}/{accession}"
-                index_url = f"{base_url}/index.json"
-                r = requests.get(index_url, headers=self.SEC_HEADERS)
-                r.raise_for_status()
-                files = r.json()["directory"]["item"]
-
-                for f in files:
-                    name = f["name"].lower()
-                    if "info" in name and name.endswith(".xml"):
-                        urls.append((f"{base_url}/{f['name']}", filing_date))
-                        break
 
+        # Select 13F-HR filings within the date range in one pass
+        mask = np.asarray(forms["form"], dtype=str) == "13F-HR"
+        filing_dates = np.asarray(forms["filingDate"], dtype="datetime64[D]")
+        if self.start_date:
+            mask &= filing_dates >= np.datetime64(self.start_date)
+        if self.end_date:
+            mask &= filing_dates <= np.datetime64(self.end_date)
+
+        candidates = []
+        for i in np.flatnonzero(mask):
+            accession = forms["accessionNumber"][i].replace("-", "")
+            base_url = (
+                f"https://www.sec.gov/Archives/edgar/data/{int(self.cik)}/{accession}"
+            )
+            candidates.append((base_url, forms["filingDate"][i], accession))
+
+        # Fetch indexes `count` candidates at a time; later ones only if some lack an infoTable
+        urls = []
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            for start in range(0, len(candidates), count):
+                batch = candidates[start : start + count]
+                indexes = executor.map(lambda c: self._fetch_index(c[0], c[2]), batch)
+                for (base_url, filing_date, accession), files in zip(batch, indexes):
+                    info_name = self._info_table_name(files)
+                    if info_name and len(urls) < count:
+                        urls.append((f"{base_url}/{info_name}", filing_date, accession))
                 if len(urls) == count:
                     break
 
@@ -75,35 +133,40 @@ class Form13FComparator:
                 )
         return urls
 
-    def _parse_xml(self, xml_text: str) -> pd.DataFrame:
-        soup = BeautifulSoup(xml_text, "lxml-xml")
-        holdings = []
-        for info in soup.find_all("infoTable"):
-            issuer = (
-                info.find("nameOfIssuer").text if info.find("nameOfIssuer") else None
-            )
-            cusip = info.find("cusip").text if info.find("cusip") else None
-            value = int(info.find("value").text) * 1000 if info.find("value") else None
-            shares = (
-                int(info.find("sshPrnamt").text) if info.find("sshPrnamt") else None
-            )
-            holdings.append(
-                {
-                    "issuer": issuer,
-                    "cusip": cusip,
-                    "value_usd": value,
-                    "shares": shares,
-                }
-            )
-        return pd.DataFrame(holdings)
+    def _parse_xml(self, xml_bytes: bytes) -> pd.DataFrame:
+        """Stream the infoTable entries and build the holdings DataFrame column-wise."""
+        issuers, cusips, values, shares = [], [], [], []
+        for _, info in etree.iterparse(io.BytesIO(xml_bytes), tag="{*}infoTable"):
+            issuers.append(info.findtext("{*}nameOfIssuer"))
+            cusips.append(info.findtext("{*}cusip"))
+            values.append(info.findtext("{*}value"))
+            shares.append(info.findtext(".//{*}sshPrnamt"))
+
+            # Free parsed entries as we go
+            info.clear()
+            while info.getprevious() is not None:
+                del info.getparent()[0]
+
+        # Convert the numeric columns in one pass each (missing/empty -> NaN)
+        return pd.DataFrame(
+            {
+                "issuer": issuers,
+                "cusip": cusips,
+                "value_usd": pd.to_numeric(
+                    pd.Series(values, dtype=object), errors="coerce"
+                )
+                * 1000,
+                "shares": pd.to_numeric(
+                    pd.Series(shares, dtype=object), errors="coerce"
+                ),
+            }
+        )
 
     def get_last_two_filings(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
         urls = self._get_recent_13f_urls(count=2)
         filings = []
-        for url, filing_date in urls:
-            r = requests.get(url, headers=self.SEC_HEADERS)
-            r.raise_for_status()
-            df = self._parse_xml(r.text)
+        for url, filing_date, accession in urls:
+            df = self._load_infotable(url, accession)
             df["filing_date"] = filing_date
             filings.append(df)
 
@@ -115,19 +178,41 @@ class Form13FComparator:
         latest_date = latest["filing_date"].iloc[0]
         prev_date = previous["filing_date"].iloc[0]
 
-        # Index by CUSIP
-        latest_idx = latest.set_index("cusip")
-        previous_idx = previous.set_index("cusip")
+        # One outer merge on CUSIP; `_row` remembers each filing's original order
+        merged = pd.merge(
+            latest.assign(_row=np.arange(len(latest))),
+            previous.assign(_row=np.arange(len(previous))),
+            on="cusip",
+            how="outer",
+            suffixes=("_new", "_old"),
+            indicator=True,
+        )
+        side = merged.pop("_merge")
+
+        # Restore the source dtypes (the outer merge upcasts ints to float)
+        new_types = {f"{c}_new": t for c, t in latest.dtypes.items() if c != "cusip"}
+        old_types = {f"{c}_old": t for c, t in previous.dtypes.items() if c != "cusip"}
+
+        def _one_sided(mask: pd.Series, suffix: str, types: dict) -> pd.DataFrame:
+            rows = merged.loc[mask].sort_values(f"_row{suffix}")[["cusip", *types]]
+            return (
+                rows.astype(types)
+                .rename(columns=lambda c: c.removesuffix(suffix))
+                .reset_index(drop=True)
+            )
 
-        new_buys = latest_idx.loc[~latest_idx.index.isin(previous_idx.index)].copy()
+        new_buys = _one_sided(side == "left_only", "_new", new_types)
         new_buys["rank_value"] = new_buys["value_usd"].rank(
             ascending=False, method="first"
         )
 
-        exits = previous_idx.loc[~previous_idx.index.isin(latest_idx.index)].copy()
+        exits = _one_sided(side == "right_only", "_old", old_types)
 
-        common = latest_idx.join(
-            previous_idx, lsuffix="_new", rsuffix="_old", how="inner"
+        common = (
+            merged.loc[side == "both"]
+            .sort_values("_row_new")[["cusip", *new_types, *old_types]]
+            .astype({**new_types, **old_types})
+            .reset_index(drop=True)
         )
 
         increases = common[common["shares_new"] > common["shares_old"]].copy()
@@ -142,10 +227,10 @@ class Form13FComparator:
         return {
             "latest_date": latest_date,
             "previous_date": prev_date,
-            "new_buys": new_buys.reset_index(),
-            "exits": exits.reset_index(),
-            "increases": increases.reset_index(),
-            "reductions": reductions.reset_index(),
+            "new_buys": new_buys,
+            "exits": exits,
+            "increases": increases.reset_index(drop=True),
+            "reductions": reductions.reset_index(drop=True),
         }
 
 
@@ -8,16 +8,27 @@ from follow_the_leaders import (
 )
 from follow_the_leaders.controller import Controller
 
-import schedule
+from datetime import datetime, timedelta, timezone
 import time
 
 
+def _seconds_until(at: str) -> float:
+    """Seconds from now until the next `at` (HH:MM, UTC)."""
+    now = datetime.now(timezone.utc)
+    hour, minute = map(int, at.split(":"))
+    target = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if target <= now:
+        target += timedelta(days=1)
+    return (target - now).total_seconds()
+
+
 def main():
     args = app_parser()
     log_level = args.log_level
     strategy_debug = args.debug
     process_form_144 = args.process_144
     run_once = args.run_once
+    max_workers = args.max_workers
 
     log_dir = ROOT_PATH / "logs"
 
@@ -32,6 +43,7 @@ def main():
         end_date=None,
         log_path="data/processed_filings.csv",
         debug=strategy_debug,
+        max_workers=max_workers,
     )
 
     if run_once:
@@ -41,22 +53,19 @@ def main():
         # The SEC EDGAR system typically posts filings between ~6 PM–10 PM ET.
         # Running the check around 7:00 AM UTC (≈2 AM ET) ensures all filings from the previous day are available.
         optimal_time = "07:00"
-        schedule.every().day.at(optimal_time).do(
-            controller.run_daily_check, process_form_144=process_form_144
-        )
 
         log_info(f"Daily filing check scheduled at {optimal_time} UTC each day.")
         log_info("Controller instance initialized — waiting for first run.\n")
 
         # ─────────────────────────────────────────────
-        # 🔁 Keep process alive
+        # 🔁 Keep process alive — sleep straight through to the next run
         # ─────────────────────────────────────────────
         try:
             while True:
-                schedule.run_pending()
-                time.sleep(30)
+                time.sleep(_seconds_until(optimal_time))
+                controller.run_daily_check(process_form_144=process_form_144)
         except KeyboardInterrupt:
-            pass
+            controller.alerter.close()
 
 
 if __name__ == "__main__":
@@ -1,34 +1,88 @@
 import requests
 from typing import Optional
+import hmac
 import threading
-import time
+from pathlib import Path
 
 from follow_the_leaders.secret_vars import TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID
 from follow_the_leaders._logger import log_info, log_error, log_debug
+from follow_the_leaders._http import DEFAULT_SESSION
+from follow_the_leaders import _json
 
 
 class TelegramAlerter:
-    def __init__(self, bot_token: str, chat_id: str, auto_listen: bool = True):
+    LONG_POLL_TIMEOUT = 25  # Seconds Telegram holds getUpdates open when idle
+    # Update types requested from Telegram (JSON-encoded). Only plain messages are
+    # handled today; new handlers must add their update type here.
+    ALLOWED_UPDATES = '["message"]'
+    UPDATES_LIMIT = 10  # Max updates per getUpdates call
+    _HTML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+    _ALIVE_COMMANDS = frozenset({"alive", "/alive", "status", "/status"})
+    # Last handled update_id per bot, kept across restarts so old commands are not
+    # answered again
+    OFFSET_DIR = Path("data")
+
+    def __init__(
+        self,
+        bot_token: str,
+        chat_id: str,
+        auto_listen: bool = True,
+        session: Optional[requests.Session] = None,
+    ):
         """Simple Telegram alert sender with HTML formatting support."""
         self.bot_token = bot_token
         self.chat_id = chat_id
+        self.session = session or DEFAULT_SESSION
         self.api_url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
         self.update_url = f"https://api.telegram.org/bot{self.bot_token}/getUpdates"
-        self.last_update_id = None  # track latest message to avoid duplicates
+        # Update ids are per bot: key the offset file by the bot id (token prefix)
+        self._offset_path = (
+            self.OFFSET_DIR / f"telegram_offset_{self.bot_token.split(':')[0]}.txt"
+        )
+        self.last_update_id = self._load_offset()  # avoids handling updates twice
+        self._webhook_secret = None  # set by register_webhook
+        self._stop = threading.Event()  # set by close() to end the listener loop
+        self._listener_thread: Optional[threading.Thread] = None
+
+        # sendMessage JSON body for the default options, serialized once up to the
+        # text field: `{...,"text":` + encoded text + `}`
+        base_payload = {
+            "chat_id": self.chat_id,
+            "parse_mode": "HTML",
+            "disable_web_page_preview": True,
+            "protect_content": False,
+        }
+        self._base_body_prefix = _json.dumps(base_payload)[:-1] + b',"text":'
 
         if auto_listen:
-            listener_thread = threading.Thread(
+            self._listener_thread = threading.Thread(
                 target=self.poll_for_commands, daemon=True
             )
-            listener_thread.start()
+            self._listener_thread.start()
             log_info("TelegramAlerter :: Started background listener thread")
 
-    @staticmethod
-    def escape_html(text: str) -> str:
+    def _load_offset(self) -> Optional[int]:
+        try:
+            return int(self._offset_path.read_text())
+        except (OSError, ValueError):
+            return None
+
+    def _save_offset(self):
+        """Atomically persist `last_update_id`."""
+        try:
+            self._offset_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self._offset_path.with_suffix(".tmp")
+            tmp.write_text(str(self.last_update_id))
+            tmp.replace(self._offset_path)
+        except OSError as e:
+            log_error(f"TelegramAlerter :: Could not save update offset: {e}")
+
+    @classmethod
+    def escape_html(cls, text: str) -> str:
         """Escape HTML special characters for safe variable interpolation."""
         if text is None:
             return ""
-        return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+        return text.translate(cls._HTML_ESCAPE_TABLE)
 
     def send_message(
         self,
@@ -38,17 +92,27 @@ class TelegramAlerter:
         protect_content: bool = False,
     ) -> bool:
         """Send an HTML-formatted message to Telegram."""
-        payload = {
-            "chat_id": self.chat_id,
-            "text": text,
-            "parse_mode": parse_mode,
-            "disable_web_page_preview": disable_web_page_preview,
-            "protect_content": protect_content,
-        }
+        # JSON body (orjson) instead of form-encoding each field
+        if parse_mode == "HTML" and disable_web_page_preview and not protect_content:
+            body = self._base_body_prefix + _json.dumps(text) + b"}"
+        else:
+            payload = {
+                "chat_id": self.chat_id,
+                "text": text,
+                "parse_mode": parse_mode,
+                "disable_web_page_preview": disable_web_page_preview,
+                "protect_content": protect_content,
+            }
+            body = _json.dumps({k: v for k, v in payload.items() if v is not None})
 
         try:
-            log_debug(f"TelegramAlerter :: Posting message: {payload}")
-            response = requests.post(self.api_url, data=payload, timeout=10)
+            log_debug("TelegramAlerter :: Posting message: %s", text)
+            response = self.session.post(
+                self.api_url,
+                data=body,
+                headers={"Content-Type": "application/json"},
+                timeout=10,
+            )
             if response.status_code == 200:
                 return True
             else:
@@ -60,62 +124,150 @@ class TelegramAlerter:
             log_error(f"TelegramAlerter :: Telegram request failed: {e}")
             return False
 
+    def _dispatch_update(self, update: dict):
+        """Handle a single getUpdates entry."""
+        message = update.get("message", {})
+        chat_id = message.get("chat", {}).get("id")
+        text = (message.get("text") or "").strip().lower()
+
+        if not chat_id or not text:
+            return
+
+        log_info("TelegramAlerter :: Received message: '%s'", text)
+
+        # Simple health check response
+        if text in self._ALIVE_COMMANDS:
+            self.send_message("✅ <b>Yes, still monitoring...</b>")
+            log_info("TelegramAlerter :: Responded to alive check")
+
+    # ─────────────────────────────────────────────
+    # Webhook mode
+    # ─────────────────────────────────────────────
+    def register_webhook(self, public_url: str, secret_token: str) -> bool:
+        """
+        Ask Telegram to push updates to `public_url`/tg/<secret_token>.
+        getUpdates is refused while a webhook is set, so the listener thread (if any)
+        is stopped once the webhook is registered; on failure it keeps polling.
+        """
+        payload = {
+            "url": f"{public_url.rstrip('/')}/tg/{secret_token}",
+            "allowed_updates": _json.loads(self.ALLOWED_UPDATES),
+            "secret_token": secret_token,
+            "max_connections": 40,
+        }
+        try:
+            response = self.session.post(
+                f"https://api.telegram.org/bot{self.bot_token}/setWebhook",
+                data=_json.dumps(payload),
+                headers={"Content-Type": "application/json"},
+                timeout=10,
+            )
+            if response.status_code == 200:
+                self._webhook_secret = secret_token
+                self.close()
+                log_info("TelegramAlerter :: Webhook registered")
+                return True
+            log_error(
+                f"TelegramAlerter :: setWebhook ERROR: {response.status_code} {response.text}"
+            )
+            return False
+        except requests.RequestException as e:
+            log_error(f"TelegramAlerter :: setWebhook request failed: {e}")
+            return False
+
+    def handle_webhook_update(self, body: bytes, secret_header: Optional[str]) -> bool:
+        """
+        Dispatch one pushed update. Meant to be called from the HTTP handler serving
+        the webhook path, with the X-Telegram-Bot-Api-Secret-Token header value.
+        """
+        if self._webhook_secret is None or not hmac.compare_digest(
+            (secret_header or "").encode(), self._webhook_secret.encode()
+        ):
+            log_error("TelegramAlerter :: Rejected webhook call with bad secret token")
+            return False
+        try:
+            self._dispatch_update(_json.loads(body))
+        except Exception as e:
+            log_error(f"TelegramAlerter :: Failed to handle webhook update: {e}")
+        return True
+
     def poll_for_commands(self, interval: int = 30):
         """
-        Poll Telegram every `interval` seconds for new messages.
+        Long-poll Telegram for new messages, re-polling as soon as a call returns.
         Responds automatically to 'alive' or '/alive'.
+        After a failed poll, waits with exponential back-off capped at `interval` seconds.
         """
         log_info("TelegramAlerter :: Listening for commands...")
 
-        while True:
+        backoff = 1
+        while not self._stop.is_set():
             try:
-                params = {"timeout": 10}
+                params = {
+                    "timeout": self.LONG_POLL_TIMEOUT,
+                    "allowed_updates": self.ALLOWED_UPDATES,
+                    "limit": self.UPDATES_LIMIT,
+                }
                 if self.last_update_id:
                     params["offset"] = self.last_update_id + 1
 
-                response = requests.get(self.update_url, params=params, timeout=20)
+                # Read timeout must outlast the server-side long poll
+                response = self.session.get(
+                    self.update_url,
+                    params=params,
+                    timeout=(10, self.LONG_POLL_TIMEOUT + 5),
+                )
                 response.raise_for_status()
-                data = response.json()
+                data = _json.loads(response.content)
 
                 if not data.get("ok"):
                     log_error(f"TelegramAlerter :: getUpdates returned error: {data}")
-                    time.sleep(interval)
+                    self._stop.wait(backoff)
+                    backoff = min(backoff * 2, interval)
                     continue
 
-                for update in data.get("result", []):
-                    self.last_update_id = update["update_id"]
+                backoff = 1
 
-                    message = update.get("message", {})
-                    chat_id = message.get("chat", {}).get("id")
-                    text = (message.get("text") or "").strip().lower()
+                updates = data.get("result", [])
+                if updates:
+                    # Advance (and persist) the offset first so a failing handler is
+                    # never replayed, not even after a restart
+                    self.last_update_id = max(
+                        self.last_update_id or 0, *(u["update_id"] for u in updates)
+                    )
+                    self._save_offset()
 
-                    if not chat_id or not text:
-                        continue
-
-                    log_info(f"TelegramAlerter :: Received message: '{text}'")
-
-                    # Simple health check response
-                    if text.lower() in (
-                        "alive",
-                        "/alive",
-                        "status",
-                        "/status",
-                    ):
-                        self.send_message("✅ <b>Yes, still monitoring...</b>")
-                        log_info("TelegramAlerter :: Responded to alive check")
-
-                time.sleep(interval)
+                for update in updates:
+                    try:
+                        self._dispatch_update(update)
+                    except Exception as e:
+                        log_error(
+                            f"TelegramAlerter :: Failed to handle update {update['update_id']}: {e}"
+                        )
 
             except Exception as e:
                 log_error(f"TelegramAlerter :: Polling error: {e}")
-                time.sleep(interval)
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, interval)
+
+        log_info("TelegramAlerter :: Listener stopped")
+
+    def close(self, timeout: float = 5.0):
+        """
+        Stop the listener loop. A long poll in flight is not interrupted, so the
+        thread may outlive `timeout` by up to LONG_POLL_TIMEOUT seconds.
+        """
+        self._stop.set()
+        if self._listener_thread is not None:
+            self._listener_thread.join(timeout=timeout)
 
 
 # ─────────────────────────────────────────────
 # 🧪 Example Test
 # ─────────────────────────────────────────────
 def main() -> int:
-    alerter = TelegramAlerter(bot_token=TELEGRAM_BOT_TOKEN, chat_id=TELEGRAM_CHAT_ID)
+    alerter = TelegramAlerter(
+        bot_token=TELEGRAM_BOT_TOKEN, chat_id=TELEGRAM_CHAT_ID, auto_listen=False
+    )
 
     msg = (
         "<b>🚀 New Trade Signal Detected!</b>\n"
@@ -134,25 +286,5 @@ def main() -> int:
     return 0
 
 
-# ─────────────────────────────────────────────
-# 🧪 Example Test
-# ─────────────────────────────────────────────
-def main() -> int:
-    alerter = TelegramAlerter(bot_token=TELEGRAM_BOT_TOKEN, chat_id=TELEGRAM_CHAT_ID)
-
-    msg = (
-        "<b>🚀 New Trade Signal Detected!</b>\n"
-        "<b>Instrument:</b> NVDA\n"
-        "<b>Signal:</b> 13F New Buy\n"
-        "<b>Confidence:</b> High\n"
-        "<b>Backtest Return:</b> +12.3%\n\n"
-        "<i>Generated automatically by FollowTheLeaders</i>\n"
-        "<u>This is ONLY a test!</u>"
-    )
-
-    alerter.send_message(msg)
-    return 0
-
-
 if __name__ == "__main__":
     main()